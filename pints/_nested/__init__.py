@@ -49,6 +49,13 @@ class NestedSampler(pints.TunableMethod):
         self._accept_count = 0
         self._n_evals = 0
 
+        # Block of points drawn from the prior in advance, so that proposing
+        # single points from the prior doesn't need a call to the prior for
+        # each point
+        self._prior_cache = np.zeros((0, self._n_parameters))
+        self._prior_cache_index = 0
+        self._prior_cache_size = 256
+
     def active_points(self):
         """
         Returns the active points from nested sampling run.
@@ -144,6 +151,18 @@ class NestedSampler(pints.TunableMethod):
         """
         raise NotImplementedError
 
+    def _sample_prior(self):
+        """
+        Returns a single point drawn from the prior, taking it from a block
+        of points that is drawn in advance and refilled when exhausted.
+        """
+        if self._prior_cache_index == len(self._prior_cache):
+            self._prior_cache = self._log_prior.sample(self._prior_cache_size)
+            self._prior_cache_index = 0
+        x = self._prior_cache[self._prior_cache_index]
+        self._prior_cache_index += 1
+        return x
+
     def _set_running_log_likelihood(self, running_log_likelihood):
         """
         Updates the current value of the threshold log-likelihood value.
@@ -172,7 +191,8 @@ class NestedSampler(pints.TunableMethod):
         # for serial evaluation just return point or None and an empty array
         if np.isscalar(fx):
             self._n_evals += 1
-            if np.isnan(fx) or fx < self._running_log_likelihood:
+            # nan compares as False, so no separate isnan check is needed
+            if not fx >= self._running_log_likelihood:
                 return None, np.array([[]])
             else:
                 proposed = self._proposed
@@ -181,49 +201,42 @@ class NestedSampler(pints.TunableMethod):
 
         # if running in parallel, then fx will be a sequence
         else:
-            a_len = len(fx)
-            self._n_evals += a_len
-            results = []
-            for i in range(a_len):
-                if np.isnan(fx[i]) or fx[i] < self._running_log_likelihood:
-                    results.append(None)
-                else:
-                    results.append(fx[i])
-            n_non_none = sum(x is not None for x in results)
+            fx = np.asarray(fx, dtype=float)
+            self._n_evals += len(fx)
+
+            # nan compares as False, so is rejected along with points below
+            # the threshold
+            accepted = fx >= self._running_log_likelihood
 
             # if none pass threshold return None and an empty array
-            if n_non_none == 0:
+            if not accepted.any():
                 return None, np.array([[]])
+            indices = np.flatnonzero(accepted)
 
             # if one passes then return it and an empty array
-            elif n_non_none == 1:
-                fx_temp = next(item for item in results if item is not None)
-                index = results.index(fx_temp)
-                proposed = self._proposed[index]
+            if len(indices) == 1:
+                index = indices[0]
                 winners = np.array([[]])
 
             # if more than a single point passes select at random from multiple
-            # non-nones and return it and an array of the other points whose
-            # likelihood exceeds threshold
+            # passing points and return it and an array of the other points
+            # whose likelihood exceeds threshold
             else:
-                fx_short = [i for i in results if i]
-                idex = [results.index(i) for i in fx_short]
-                proposed_short = [self._proposed[i] for i in idex]
-                fx_temp = np.random.choice(fx_short)
-                index_temp = results.index(fx_temp)
-                proposed = self._proposed[index_temp]
-                index1 = fx_short.index(fx_temp)
-                del proposed_short[index1]
-                fx_short.remove(fx_temp)
-                winners = np.transpose(
-                    np.vstack([np.transpose(proposed_short), fx_short]))
+                j = np.random.randint(len(indices))
+                index = indices[j]
+                others = np.delete(indices, j)
+                winners = np.empty((len(others), self._n_parameters + 1))
+                winners[:, :-1] = self._proposed[others]
+                winners[:, -1] = fx[others]
+            fx_temp = fx[index]
+            proposed = self._proposed[index]
 
         self._m_active[self._min_index, :] = np.concatenate(
             (proposed, np.array([fx_temp])))
         self._min_index = np.argmin(
             self._m_active[:, self._n_parameters])
         self._set_running_log_likelihood(
-            np.min(self._m_active[:, self._n_parameters]))
+            self._m_active[self._min_index, self._n_parameters])
         self._accept_count += 1
         return proposed, winners
 
@@ -589,7 +602,8 @@ class NestedController(object):
                     self._sampler._min_index = np.argmin(
                         self._sampler._m_active[:, self._n_parameters])
                     self._sampler._set_running_log_likelihood(
-                        np.min(self._sampler._m_active[:, self._n_parameters])
+                        self._sampler._m_active[
+                            self._sampler._min_index, self._n_parameters]
                     )
                     self._sampler._accept_count += 1
                     i_iter_complete = 1
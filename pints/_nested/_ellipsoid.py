@@ -10,6 +10,7 @@ from __future__ import absolute_import, division
 from __future__ import print_function, unicode_literals
 import pints
 import numpy as np
+import scipy.linalg
 
 
 class NestedEllipsoidSampler(pints.NestedSampler):
@@ -130,6 +131,20 @@ class NestedEllipsoidSampler(pints.NestedSampler):
         self._alpha = 0.2
         self._A = None
         self._centroid = None
+        self._R = None
+
+        # Accept count at which the ellipsoid was last fitted: ask() can be
+        # called several times for the same set of active points, and the
+        # ellipsoid only needs fitting once for each set
+        self._ellipsoid_accept_count = None
+
+        # Block of points drawn uniformly from the unit hypersphere in
+        # advance. These don't depend on the ellipsoid, so single proposals
+        # can be made by transforming one of them with the current ellipsoid,
+        # without drawing random numbers for each proposal.
+        self._hypersphere_cache = np.zeros((0, self._n_parameters))
+        self._hypersphere_cache_index = 0
+        self._hypersphere_cache_size = 256
 
     def set_dynamic_enlargement_factor(self, dynamic_enlargement_factor):
         """
@@ -202,21 +217,18 @@ class NestedEllipsoidSampler(pints.NestedSampler):
         if (i + 1) % self._n_rejection_samples == 0:
             self._rejection_phase = False
             # determine bounding ellipsoid
-            self._A, self._centroid = self._minimum_volume_ellipsoid(
-                self._m_active[:, :self._n_parameters]
-            )
+            self._update_ellipsoid()
 
         if self._rejection_phase:
             if n_points > 1:
                 self._proposed = self._log_prior.sample(n_points)
             else:
-                self._proposed = self._log_prior.sample(n_points)[0]
+                self._proposed = self._sample_prior()
         else:
             # update bounding ellipsoid if sufficient samples taken
             if ((i + 1 - self._n_rejection_samples)
                     % self._ellipsoid_update_gap == 0):
-                self._A, self._centroid = self._minimum_volume_ellipsoid(
-                    self._m_active[:, :self._n_parameters])
+                self._update_ellipsoid()
             # From Feroz-Hobson (2008) below eq. (14)
             if self._dynamic_enlargement_factor:
                 f = (
@@ -226,7 +238,7 @@ class NestedEllipsoidSampler(pints.NestedSampler):
                 self._enlargement_factor = 1 + f
             # propose by sampling within ellipsoid
             self._proposed = self._ellipsoid_sample(
-                self._enlargement_factor, self._A, self._centroid, n_points)
+                self._enlargement_factor, n_points)
         return self._proposed
 
     def set_enlargement_factor(self, enlargement_factor=1.1):
@@ -272,75 +284,101 @@ class NestedEllipsoidSampler(pints.NestedSampler):
         Finds an approximate minimum bounding ellipse in "center form":
         ``(x-c).T * A * (x-c) = 1``.
         """
-        cov = np.cov(np.transpose(points))
-        cov_inv = np.linalg.inv(cov)
+        # centre the points once, and build the covariance matrix from the
+        # centred points directly
         c = np.mean(points, axis=0)
-        dist = np.zeros(len(points))
-        for i in range(len(points)):
-            dist[i] = np.matmul(np.matmul(points[i] - c, cov_inv),
-                                points[i] - c)
+        x = np.transpose(points - c)
+        cov = np.dot(x, np.transpose(x)) / (len(points) - 1)
+
+        # the covariance matrix is symmetric positive definite, so use its
+        # Cholesky factor L rather than an explicit inverse: the squared
+        # Mahalanobis distances are the squared norms of L^-1 (x - c)
+        L = scipy.linalg.cholesky(cov, lower=True)
+        z = scipy.linalg.solve_triangular(L, x, lower=True)
+        dist = np.sum(z**2, axis=0)
+        cov_inv = scipy.linalg.cho_solve((L, True), np.eye(len(c)))
         enlargement_factor = np.max(dist)
         A = (1 - tol) * (1.0 / enlargement_factor) * cov_inv
         return A, c
 
-    def _ellipsoid_sample(self, enlargement_factor, A, centroid, n_points):
+    def _update_ellipsoid(self):
+        """
+        Fits the bounding ellipsoid to the current active points, unless it
+        has already been fitted to them.
         """
-        Draws from the enlarged bounding ellipsoid.
+        if self._ellipsoid_accept_count == self._accept_count:
+            return
+        self._A, self._centroid = self._minimum_volume_ellipsoid(
+            self._m_active[:, :self._n_parameters])
+        self._ellipsoid_accept_count = self._accept_count
+
+        # calculate the matrix R that scales points in the unit hypersphere by
+        # the square roots of the eigen_values of the ellipsoid's covariance
+        # matrix and rotates them with its eigen_vectors, once per fit.
+        # The covariance matrix is the inverse of the symmetric matrix A, so
+        # it shares A's eigen_vectors and has the reciprocal eigen_values.
+        eigen_values, eigen_vectors = np.linalg.eigh(self._A)
+        self._R = eigen_vectors / np.sqrt(eigen_values)
+
+    def _ellipsoid_sample(self, enlargement_factor, n_points):
         """
+        Draws from the bounding ellipsoid, enlarged by ``enlargement_factor``.
+        """
+        # enlarging the ellipsoid scales the eigen_values of its covariance
+        # matrix by enlargement_factor, and so R by its square root
+        R = np.sqrt(enlargement_factor) * self._R
         if n_points > 1:
-            return self._draw_from_ellipsoid(
-                np.linalg.inv((1 / enlargement_factor) * A),
-                centroid, n_points)
+            return self._draw_from_ellipsoid(R, self._centroid, n_points)
         else:
-            return self._draw_from_ellipsoid(
-                np.linalg.inv((1 / enlargement_factor) * A), centroid, 1)[0]
+            return np.dot(R, self._sample_unit_hypersphere()) + self._centroid
 
-    def _draw_from_ellipsoid(self, covmat, cent, npts):
+    def _draw_from_ellipsoid(self, R, cent, npts):
         """
         Draw ``npts`` random uniform points from within an ellipsoid with a
-        covariance matrix covmat and a centroid cent, as per:
+        centroid cent, obtained by transforming the unit hypersphere with the
+        matrix R, as per:
         http://www.astro.gla.ac.uk/~matthew/blog/?p=368
         """
-        try:
-            ndims = covmat.shape[0]
-        except IndexError:  # pragma: no cover
-            ndims = 1
+        pnts = self._draw_from_unit_hypersphere(len(cent), npts)
 
-        # calculate eigen_values (e) and eigen_vectors (v)
-        eigen_values, eigen_vectors = np.linalg.eig(covmat)
-        idx = (-eigen_values).argsort()[::-1][:ndims]
-        e = eigen_values[idx]
-        v = eigen_vectors[:, idx]
-        e = np.diag(e)
+        # scale and rotate points to the ellipsoid and add centroid
+        return np.dot(pnts, np.transpose(R)) + cent
 
+    def _draw_from_unit_hypersphere(self, ndims, npts):
+        """
+        Draw ``npts`` random uniform points from within the unit hypersphere
+        in ``ndims`` dimensions.
+        """
         # generate radii of hyperspheres
-        rs = np.random.uniform(0, 1, npts)
+        rs = np.random.random_sample(npts)
 
         # generate points
-        pt = np.random.normal(0, 1, [npts, ndims])
+        pt = np.random.standard_normal((npts, ndims))
 
         # get scalings for each point onto the surface of a unit hypersphere
-        fac = np.sum(pt**2, axis=1)
+        # (einsum gives the squared norms without a temporary pt**2 array)
+        fac = np.einsum('ij,ij->i', pt, pt)
 
         # calculate scaling for each point to be within the unit hypersphere
         # with radii rs
         fac = (rs**(1 / ndims)) / np.sqrt(fac)
-        pnts = np.zeros((npts, ndims))
-
-        # scale points to the ellipsoid using the eigen_values and rotate with
-        # the eigen_vectors and add centroid
-        d = np.sqrt(np.diag(e))
-        d.shape = (ndims, 1)
-
-        for i in range(0, npts):
-            # scale points to a uniform distribution within unit hypersphere
-            pnts[i, :] = fac[i] * pt[i, :]
-            pnts[i, :] = np.dot(
-                np.multiply(pnts[i, :], np.transpose(d)),
-                np.transpose(v)
-            ) + cent
-
-        return pnts
+
+        # scale points to a uniform distribution within unit hypersphere
+        return fac[:, np.newaxis] * pt
+
+    def _sample_unit_hypersphere(self):
+        """
+        Returns a single random uniform point from within the unit
+        hypersphere, taking it from a block of points that is drawn in advance
+        and refilled when exhausted.
+        """
+        if self._hypersphere_cache_index == len(self._hypersphere_cache):
+            self._hypersphere_cache = self._draw_from_unit_hypersphere(
+                self._n_parameters, self._hypersphere_cache_size)
+            self._hypersphere_cache_index = 0
+        x = self._hypersphere_cache[self._hypersphere_cache_index]
+        self._hypersphere_cache_index += 1
+        return x
 
     def name(self):
         """ See :meth:`pints.NestedSampler.name()`. """
@@ -85,7 +85,7 @@ class NestedRejectionSampler(pints.NestedSampler):
         if n_points > 1:
             self._proposed = self._log_prior.sample(n_points)
         else:
-            self._proposed = self._log_prior.sample(n_points)[0]
+            self._proposed = self._sample_prior()
         return self._proposed
 
     def n_hyper_parameters(self):
@@ -150,6 +150,16 @@ class TestNestedEllipsoidSampler(unittest.TestCase):
         self.assertTrue(not np.array_equal(A1, A2))
         self.assertTrue(not np.array_equal(c1, c2))
 
+        # test that the ellipsoid is fitted only once per set of active points
+        sampler._accept_count = 109
+        sampler.ask(1)
+        A3 = sampler._A
+        sampler.ask(1)
+        self.assertIs(sampler._A, A3)
+        sampler._accept_count += 10
+        sampler.ask(1)
+        self.assertIsNot(sampler._A, A3)
+
         # test multiple points being asked and tell'd
         sampler = pints.NestedEllipsoidSampler(self.log_prior)
         pts = sampler.ask(50)
@@ -164,6 +174,59 @@ class TestNestedEllipsoidSampler(unittest.TestCase):
         for i in range(100):
             self.assertEqual(len(sampler.ask(20)), 20)
 
+    def test_minimum_volume_ellipsoid(self):
+        # Tests that the fitted ellipsoid just bounds the points
+        sampler = pints.NestedEllipsoidSampler(self.log_prior)
+        np.random.seed(1)
+        points = np.random.multivariate_normal(
+            [1, 2, 3], [[2, 0.5, 0], [0.5, 1, 0.2], [0, 0.2, 3]], size=200)
+        A, c = sampler._minimum_volume_ellipsoid(points)
+        self.assertTrue(np.allclose(c, np.mean(points, axis=0)))
+        self.assertTrue(np.allclose(A, A.T))
+        x = points - c
+        dist = np.array([np.dot(np.dot(y, A), y) for y in x])
+        self.assertAlmostEqual(np.max(dist), 1)
+
+        # A is the scaled inverse covariance matrix of the points
+        cov_inv = np.linalg.inv(np.cov(np.transpose(points)))
+        scale = np.max([np.dot(np.dot(y, cov_inv), y) for y in x])
+        self.assertTrue(np.allclose(A, cov_inv / scale))
+
+    def test_draw_from_ellipsoid(self):
+        # Tests that points are drawn from within the ellipsoid
+        sampler = pints.NestedEllipsoidSampler(self.log_prior)
+        A = np.array([[4.0, 1.0], [1.0, 2.0]])
+        c = np.array([1.0, -3.0])
+        e, v = np.linalg.eigh(np.linalg.inv(A))
+        pts = sampler._draw_from_ellipsoid(v * np.sqrt(e), c, 1000)
+        self.assertEqual(pts.shape, (1000, 2))
+        x = pts - c
+        dist = np.sum(np.dot(x, A) * x, axis=1)
+        self.assertTrue(np.all(dist <= 1))
+        self.assertTrue(np.max(dist) > 0.9)
+
+    def test_ellipsoid_sample(self):
+        # Tests that points are drawn from within the enlarged ellipsoid
+        sampler = pints.NestedEllipsoidSampler(self.log_prior)
+        sampler.set_n_active_points(50)
+        sampler._m_active[:, :2] = self.log_prior.sample(50)
+        sampler._update_ellipsoid()
+        pts = sampler._ellipsoid_sample(2.0, 1000)
+        self.assertEqual(pts.shape, (1000, 2))
+        x = pts - sampler._centroid
+        dist = np.sum(np.dot(x, sampler._A) * x, axis=1)
+        self.assertTrue(np.all(dist <= 2))
+        self.assertTrue(np.max(dist) > 1.5)
+        self.assertEqual(sampler._ellipsoid_sample(2.0, 1).shape, (2, ))
+
+        # single points are transformed from a block of points in the unit
+        # hypersphere
+        pts = np.array([sampler._ellipsoid_sample(2.0, 1) for i in range(300)])
+        x = pts - sampler._centroid
+        dist = np.sum(np.dot(x, sampler._A) * x, axis=1)
+        self.assertTrue(np.all(dist <= 2))
+        self.assertEqual(sampler._hypersphere_cache.shape, (256, 2))
+
     def test_dynamic_enlargement_factor(self):
         # tests dynamic enlargement factor runs
         sampler = pints.NestedController(self.log_likelihood,
@@ -95,6 +95,13 @@ class TestNestedRejectionSampler(unittest.TestCase):
         proposed = sampler.tell(fx)
         self.assertTrue(len(proposed) > 1)
 
+        # test single points are drawn from the prior in blocks
+        sampler = pints.NestedRejectionSampler(self.log_prior)
+        np.random.seed(2)
+        pts = [np.copy(sampler.ask(1)) for i in range(300)]
+        np.random.seed(2)
+        self.assertTrue(np.array_equal(pts, self.log_prior.sample(300)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -295,6 +295,20 @@ class TestNestedController(unittest.TestCase):
         sample, other = sampler.tell(fx)
         self.assertEqual(sample[0], pts[1][0])
 
+        # test if fx has several non-nones: one is returned and the others
+        # are returned alongside their log-likelihoods
+        sampler = pints.NestedEllipsoidSampler(self.log_prior)
+        pts = sampler.ask(4)
+        fx = [-10, np.nan, -20, -30]
+        sample, other = sampler.tell(fx)
+        self.assertEqual(other.shape, (2, 3))
+        passed = [0, 2, 3]
+        chosen = [i for i in passed if np.array_equal(sample, pts[i])]
+        self.assertEqual(len(chosen), 1)
+        others = [i for i in passed if i != chosen[0]]
+        self.assertTrue(np.array_equal(other[:, :2], pts[others]))
+        self.assertTrue(np.array_equal(other[:, 2], np.array(fx)[others]))
+
     def test_early_termination(self):
         # tests that nested sampling terminates early with a large
         # threshold